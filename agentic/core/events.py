@@ -1,38 +1,167 @@
 # events.py
 
 from __future__ import annotations
-from typing import Any, Callable, List, Optional, Dict, Awaitable
-from pydantic import BaseModel, Field
+from collections import deque
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Deque, List, Optional, Mapping, Awaitable, Sequence, Set
 from datetime import datetime, timezone
-import asyncio, inspect
+import asyncio, inspect, logging
+import orjson
 
-class AgentEvent(BaseModel):
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+logger = logging.getLogger(__name__)
+
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_PASSTHROUGH_DATACLASS
+
+def _json_default(value: Any) -> Any:
+    """Reduce event payload values orjson cannot serialise natively."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    # Agents and tools are referenced by name rather than expanded
+    name = getattr(value, "name", None)
+    if isinstance(name, str):
+        return name
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    # Custom sequences and sets (deques, lazy views, ...) become JSON arrays
+    if isinstance(value, (Sequence, AbstractSet)) and not isinstance(value, (str, bytes, bytearray)):
+        return list(value)
+    return repr(value)
+
+# Slotted dataclass rather than a Pydantic model: events are created for every hook call,
+# are never parsed from untrusted input, and should stay cheap to allocate.
+@dataclass(slots=True, kw_only=True)
+class AgentEvent:
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     event_type: str
     event_name: Optional[str] = None
     source: str
     span_id: Optional[str] = None
-    data: Dict[str, Any] = Field(default_factory=dict)
+    # Shared by every subscriber; treat as read-only (hooks pass a MappingProxyType)
+    data: Mapping[str, Any] = field(default_factory=dict)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialise the event with orjson, e.g. for websocket/SSE transport or log files."""
+        return orjson.dumps(
+            {
+                "timestamp": self.timestamp,
+                "event_type": self.event_type,
+                "event_name": self.event_name,
+                "source": self.source,
+                "span_id": self.span_id,
+                "data": self.data,
+            },
+            default=_json_default,
+            option=_JSON_OPTIONS,
+        )
 
 # Define the subscriber as an async callable
 EventSubscriber = Callable[[AgentEvent], Awaitable[None]]
 
 class EventPublisher:
-    def __init__(self, subscribers: Optional[List[EventSubscriber]] = None):
-        self._subscribers = subscribers or []
+    def __init__(
+        self,
+        subscribers: Optional[Sequence[EventSubscriber]] = None,
+        max_batch: int = 32,
+        flush_delay: float = 0.005,
+        max_pending: int = 1024,
+        fire_and_forget: bool = False,
+        subscriber_timeout: Optional[float] = None,
+    ):
+        # Frozen at construction: the fan-out loop iterates a tuple, and callers' lists can't change it
+        self._subscribers = tuple(subscribers or ())
+        # Split once here instead of checking iscoroutinefunction for every event
+        self._async_subscribers = tuple(s for s in self._subscribers if inspect.iscoroutinefunction(s))
+        self._sync_subscribers = tuple(s for s in self._subscribers if not inspect.iscoroutinefunction(s))
+        self._max_batch = max_batch
+        self._flush_delay = flush_delay
+        self._max_pending = max_pending
+        self._pending: Deque[AgentEvent] = deque()
+        self._batch_ready = asyncio.Event()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._flushing = False
+        # With fire_and_forget, publishing does not wait for subscribers; flush() still does
+        self._fire_and_forget = fire_and_forget
+        self._background: Set[asyncio.Task] = set()
+        # Optional per-subscriber deadline so one slow subscriber cannot hold up the others
+        self._subscriber_timeout = subscriber_timeout
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
 
     # Make this method async
     async def publish_event(self, event: AgentEvent):
-        tasks = []
-        for subscriber in self._subscribers:
+        if not self._subscribers:
+            return
+        calls = [subscriber(event) for subscriber in self._async_subscribers]
+        # Sync subscribers may block (disk IO, formatting), so keep them off the event loop
+        calls.extend(asyncio.to_thread(subscriber, event) for subscriber in self._sync_subscribers)
+        if self._subscriber_timeout is not None:
+            calls = [asyncio.wait_for(call, self._subscriber_timeout) for call in calls]
+        if self._fire_and_forget:
+            for call in calls:
+                task = asyncio.create_task(call)
+                self._background.add(task)
+                task.add_done_callback(self._on_background_done)
+            return
+        if len(calls) == 1:
+            # Common single-subscriber case: await inline rather than wrapping it in a task
             try:
-                if inspect.iscoroutinefunction(subscriber):
-                    tasks.append(asyncio.create_task(subscriber(event)))
-                else:
-                    # run sync subscribers immediately
-                    subscriber(event)
-            except Exception as e:
-
-                raise
-        if tasks:
-            await asyncio.gather(*tasks)
+                await calls[0]
+            except Exception:
+                logger.exception("Event subscriber failed")
+            return
+        # gather wraps each call in a Task (via ensure_future); only the single-call path above avoids one.
+        # A failing subscriber must not stop the others or kill the drain task
+        for result in await asyncio.gather(*calls, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error("Event subscriber failed", exc_info=result)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Event subscriber failed", exc_info=task.exception())
+
+    async def publish_events(self, events: List[AgentEvent]):
+        for event in events:
+            await self.publish_event(event)
+
+    async def enqueue_event(self, event: AgentEvent):
+        """Buffer an event for batched delivery; only waits when the buffer is full."""
+        if not self._subscribers:
+            # Nobody to deliver to; don't start a drain task just to discard the event
+            return
+        self._pending.append(event)
+        if len(self._pending) >= self._max_batch:
+            self._batch_ready.set()
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        if len(self._pending) >= self._max_pending:
+            await self.flush()
+
+    async def flush(self):
+        """Wait until every buffered event has been delivered."""
+        if self._drain_task is not None:
+            self._flushing = True
+            self._batch_ready.set()
+            try:
+                await self._drain_task
+            finally:
+                self._flushing = False
+        if self._background:
+            # Failures were already logged by the done callback
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    async def _drain(self):
+        while self._pending:
+            # Coalesce: wait for a full batch or the flush delay, whichever comes first
+            if len(self._pending) < self._max_batch and not self._flushing:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self._flush_delay)
+                except asyncio.TimeoutError:
+                    pass
+            batch = [self._pending.popleft() for _ in range(min(self._max_batch, len(self._pending)))]
+            await self.publish_events(batch)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Any, Optional, Protocol
 
 from agents import Agent, AgentHooks, ModelResponse, RunContextWrapper, Tool, TResponseInputItem
 
@@ -10,44 +12,109 @@ from agentic.core.events import AgentEvent, EventPublisher
 from agents.tracing import get_current_span
 
 
-def get_event_publisher(context_wrapper: RunContextWrapper) -> Optional[EventPublisher]:
-    ctx = getattr(context_wrapper, "context", None)
-    if isinstance(ctx, dict):
-        pub = ctx.get("event_publisher")
-        return pub if isinstance(pub, EventPublisher) else None
-    return None
+class HasEvents(Protocol):
+    event_publisher: Optional[EventPublisher]
+
+
+def get_event_publisher(context_wrapper: RunContextWrapper[HasEvents]) -> Optional[EventPublisher]:
+    # The publisher is resolved once per run and stored on the context, so this is a single attribute read
+    return getattr(context_wrapper.context, "event_publisher", None)
+
+
+def has_event_listeners(context_wrapper: RunContextWrapper[HasEvents]) -> bool:
+    publisher = get_event_publisher(context_wrapper)
+    return publisher is not None and publisher.has_subscribers()
+
+
+def current_span_id() -> Optional[str]:
+    span = get_current_span()
+    return span.span_id if span else None
 
 
 async def emit_agent_event(
     context_wrapper: RunContextWrapper,
     source: str,
     event_type: str,
+    span_id: Optional[str] = None,
     **data: Any,
 ) -> None:
+    """Publish an event; pass ``span_id`` when already known to skip the span lookup."""
     publisher = get_event_publisher(context_wrapper)
-    span = get_current_span()
-    span_id = span.span_id if span else None
-    
-    if publisher:
-        await publisher.publish_event(
-            AgentEvent(event_type=event_type, source=source, span_id=span_id, data=data)
-        )
+    # Nobody is listening: skip span lookup and event construction
+    if publisher is None or not publisher.has_subscribers():
+        return
+
+    if span_id is None:
+        span_id = current_span_id()
+    await publisher.enqueue_event(
+        AgentEvent(event_type=event_type, source=source, span_id=span_id, data=MappingProxyType(data))
+    )
+
+
+def _collect_citations(messages: Sequence[Any]) -> list:
+    """URL citations from the messages' annotations, deduplicated by URL."""
+    citations_by_url: dict[str, Any] = {}
+    for item in messages:
+        for content_part in item.content:
+            for annotation in getattr(content_part, 'annotations', None) or ():
+                if getattr(annotation, 'type', None) == 'url_citation':
+                    # First citation for a URL wins
+                    citations_by_url.setdefault(annotation.url, annotation)
+    return list(citations_by_url.values())
+
+
+async def _emit_web_search(context: RunContextWrapper, agent: Agent, item: Any, citations: list, span_id: Optional[str]) -> None:
+    # Use citations found in the response as sources
+    # If item.action.sources is None (which it usually is), use the collected citations
+    action = item.action
+    await emit_agent_event(
+        context,
+        agent.name,
+        "tool_web_search_event",
+        span_id=span_id,
+        query=action.query,
+        sources=getattr(action, 'sources', None) or citations,
+        tool_call_id=item.id
+    )
+
+
+async def _emit_code_interpreter(context: RunContextWrapper, agent: Agent, item: Any, citations: list, span_id: Optional[str]) -> None:
+    await emit_agent_event(
+        context,
+        agent.name,
+        "tool_code_interpreter_event",
+        span_id=span_id,
+        code=item.code,
+        outputs=item.outputs,
+        tool_call_id=item.id
+    )
+
+
+async def _emit_function_call(context: RunContextWrapper, agent: Agent, item: Any, citations: list, span_id: Optional[str]) -> None:
+    await emit_agent_event(
+        context,
+        agent.name,
+        "tool_call_detected_event",
+        span_id=span_id,
+        tool_name=item.name,
+        arguments=item.arguments,
+        tool_call_id=item.id
+    )
+
+
+# Response output item type -> emitter for the matching tool event
+_LLM_ITEM_HANDLERS = {
+    'web_search_call': _emit_web_search,
+    'code_interpreter_call': _emit_code_interpreter,
+    'function_call': _emit_function_call,
+}
 
 
 class EventPublishingHook(AgentHooks):
     """Broadcasts every lifecycle callback to the shared EventPublisher."""
 
-    async def _emit(
-        self,
-        context_wrapper: RunContextWrapper,
-        source: str,
-        event_type: str,
-        **data: Any,
-    ) -> None:
-        await emit_agent_event(context_wrapper, source, event_type, **data)
-
     async def on_start(self, context: RunContextWrapper, agent: Agent) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             agent.name,
             "agent_started_stream_event",
@@ -55,7 +122,7 @@ class EventPublishingHook(AgentHooks):
         )
 
     async def on_end(self, context: RunContextWrapper, agent: Agent, output: Any) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             agent.name,
             "agent_ended_stream_event",
@@ -64,7 +131,7 @@ class EventPublishingHook(AgentHooks):
         )
 
     async def on_handoff(self, context: RunContextWrapper, agent: Agent, source: Agent) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             source.name,
             "agent_handoff_stream_event",
@@ -73,7 +140,7 @@ class EventPublishingHook(AgentHooks):
         )
 
     async def on_tool_start(self, context: RunContextWrapper, agent: Agent, tool: Tool) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             agent.name,
             "tool_started_stream_event",
@@ -82,7 +149,7 @@ class EventPublishingHook(AgentHooks):
         )
 
     async def on_tool_end(self, context: RunContextWrapper, agent: Agent, tool: Tool, result: str) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             agent.name,
             "tool_ended_stream_event",
@@ -98,64 +165,34 @@ class EventPublishingHook(AgentHooks):
         response: ModelResponse,
     ) -> None:
         # Inspect output for hosted tool calls and emit specific events
-        if hasattr(response, 'output'):
-            # First, collect all annotations from any message items
-            # These likely contain the citations for the web searches in this turn
-            citations = []
-            seen_urls = set()
-            
-            for item in response.output:
-                if hasattr(item, 'type') and item.type == 'message':
-                    for content_part in item.content:
-                        if hasattr(content_part, 'annotations'):
-                            for annotation in content_part.annotations:
-                                if hasattr(annotation, 'type') and annotation.type == 'url_citation':
-                                    # Deduplicate by URL
-                                    if annotation.url not in seen_urls:
-                                        citations.append(annotation)
-                                        seen_urls.add(annotation.url)
-
-            # Now emit events, attaching citations to web_search calls
-            for item in response.output:
-                if hasattr(item, 'type'):
-                    if item.type == 'web_search_call':
-                        # Use citations found in the response as sources
-                        # If item.action.sources is None (which it usually is), use the collected citations
-                        sources = getattr(item.action, 'sources', None) or citations
-                        
-                        await self._emit(
-                            context,
-                            agent.name,
-                            "tool_web_search_event",
-                            query=item.action.query,
-                            sources=sources,
-                            tool_call_id=item.id
-                        )
-                    elif item.type == 'code_interpreter_call':
-
-                        
-                        await self._emit(
-                            context,
-                            agent.name,
-                            "tool_code_interpreter_event",
-                            code=item.code,
-                            outputs=item.outputs,
-                            tool_call_id=item.id
-                        )
-                    elif item.type == 'function_call':
-                        await self._emit(
-                            context,
-                            agent.name,
-                            "tool_call_detected_event",
-                            tool_name=item.name,
-                            arguments=item.arguments,
-                            tool_call_id=item.id
-                        )
-
-        await self._emit(
+        if not has_event_listeners(context):
+            return
+
+        # All events below are emitted from the same span, so resolve it once
+        span_id = current_span_id()
+
+        # Single pass over the output: remember messages (they carry the citations) and tool items
+        messages = []
+        tool_items = []
+        has_web_search = False
+        for item in getattr(response, 'output', ()):
+            item_type = getattr(item, 'type', None)
+            if item_type == 'message':
+                messages.append(item)
+            elif item_type in _LLM_ITEM_HANDLERS:
+                tool_items.append((_LLM_ITEM_HANDLERS[item_type], item))
+                has_web_search = has_web_search or item_type == 'web_search_call'
+
+        # Citations are only attached to web searches, so skip the annotation walk without one
+        citations = _collect_citations(messages) if has_web_search else []
+        for handler, item in tool_items:
+            await handler(context, agent, item, citations, span_id)
+
+        await emit_agent_event(
             context,
             agent.name,
             "llm_ended_stream_event",
+            span_id=span_id,
             agent=agent,
             response=response,
         )
@@ -167,7 +204,7 @@ class EventPublishingHook(AgentHooks):
         system_prompt: Optional[str],
         input_items: list[TResponseInputItem],
     ) -> None:
-        await self._emit(
+        await emit_agent_event(
             context,
             agent.name,
             "llm_started_stream_event",
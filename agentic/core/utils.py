@@ -1,19 +1,56 @@
-from typing import AsyncIterator, Optional, Dict, Any
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+import os
 from agents import Agent, Runner
+from agents.models import _openai_shared
+from agents.models.openai_provider import shared_http_client
+from openai import AsyncOpenAI
 from agents.stream_events import AgentUpdatedStreamEvent, RawResponsesStreamEvent
 from openai.types.responses.response_text_delta_event import ResponseTextDeltaEvent
 from agentic.core.events import EventPublisher
 
+@dataclass
+class AgentRunContext:
+    """Default run context; satisfies the HasEvents protocol used by the hooks."""
+    event_publisher: Optional[EventPublisher] = None
+
+def _model_client() -> AsyncOpenAI:
+    """The client OpenAIProvider builds for the agents: the SDK default client if one was set,
+    otherwise the default key and OPENAI_BASE_URL on the SDK's shared HTTP client."""
+    default_client = _openai_shared.get_default_openai_client()
+    if default_client is not None:
+        return default_client
+    return AsyncOpenAI(
+        api_key=_openai_shared.get_default_openai_key(),
+        base_url=os.getenv("OPENAI_BASE_URL"),
+        http_client=shared_http_client(),
+    )
+
+async def warm_up_model_connection(timeout: float = 2.0) -> None:
+    """Open a pooled connection to the model API shortly before a prompt is sent.
+
+    The SDK reuses one HTTP client across runs, so a cheap authenticated request here moves the
+    TLS/HTTP setup off the run. Idle pooled connections expire after a few seconds, so call this
+    when a prompt is imminent (e.g. the input gains focus), not at startup. Failures are ignored.
+    """
+    try:
+        await _model_client().with_options(timeout=timeout, max_retries=0).models.list()
+    except Exception:
+        pass
+
 async def stream_agent_output(
     agent: Agent, 
     prompt: str, 
-    event_publisher: Optional[EventPublisher] = None
+    event_publisher: Optional[EventPublisher] = None,
+    min_chunk_chars: int = 64,
 ) -> AsyncIterator[str]:
-    
-    context: Optional[Dict[str, Any]] = None
-    
-    if event_publisher:
-        context = {"event_publisher": event_publisher}
+    """Stream the agent's text output.
+
+    Text deltas are coalesced and yielded once at least ``min_chunk_chars`` characters are
+    buffered, or as soon as any other event marks the end of a burst of deltas.
+    """
+
+    context = AgentRunContext(event_publisher=event_publisher)
     
     result = Runner.run_streamed(
         agent, 
@@ -22,23 +59,47 @@ async def stream_agent_output(
     )
 
     yielded = False
-    active_agent_name = agent.name
+    main_agent_name = agent.name
+    # Recomputed only on agent switches, so raw events test a bool instead of comparing names
+    main_agent_active = True
+    buffer: list[str] = []
+    buffered_chars = 0
+
+    # Local aliases for the hot loop; the SDK emits these exact classes, so identity checks suffice
+    raw_event_cls = RawResponsesStreamEvent
+    agent_updated_cls = AgentUpdatedStreamEvent
+    text_delta_cls = ResponseTextDeltaEvent
     
     async for event in result.stream_events():
-        
-        if isinstance(event, AgentUpdatedStreamEvent):
-            active_agent_name = event.new_agent.name
-            continue
-
-        if isinstance(event, RawResponsesStreamEvent):
-            if active_agent_name != agent.name:
-                continue
-            data = event.data
-            if isinstance(data, ResponseTextDeltaEvent):
-                chunk = data.delta or ""
-                if chunk:
-                    yielded = True
-                    yield chunk
+        event_cls = event.__class__
+
+        if event_cls is raw_event_cls:
+            if main_agent_active:
+                data = event.data
+                if data.__class__ is text_delta_cls:
+                    chunk = data.delta or ""
+                    if chunk:
+                        buffer.append(chunk)
+                        buffered_chars += len(chunk)
+                    if buffered_chars < min_chunk_chars:
+                        continue
+
+        elif event_cls is agent_updated_cls:
+            main_agent_active = event.new_agent.name == main_agent_name
+
+        if buffer:
+            yielded = True
+            yield "".join(buffer)
+            buffer.clear()
+            buffered_chars = 0
+
+    if buffer:
+        yielded = True
+        yield "".join(buffer)
+
+    if event_publisher:
+        # Deliver any events still buffered by the hooks before the stream ends
+        await event_publisher.flush()
 
     if not yielded:
         final_output = result.final_output
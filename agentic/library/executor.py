@@ -3,9 +3,10 @@ from openai.types.responses.web_search_tool_param import UserLocation
 from agentic.core.hooks import EventPublishingHook
 
 DEFAULT_MODEL = 'gpt-5.1'
-DEFAULT_MODEL_SETTINGS = ModelSettings(tool_choice="auto")
+DEFAULT_MODEL_SETTINGS = ModelSettings(tool_choice="auto", extra_args={"prompt_cache_key": "library-executor"})
 
-BASE_TOOLS = [
+# Immutable so workflows can share the same tool instances; Agent requires a list, hence list(...)
+BASE_TOOLS = (
     WebSearchTool(user_location=UserLocation(country='GB', type='approximate')),
     CodeInterpreterTool(
         tool_config={
@@ -13,18 +14,20 @@ BASE_TOOLS = [
             "container": {"type": "auto"},
         }
     ),
-]
+)
+
+EXECUTOR_PROMPT = (
+    "Execute provided task. Use tools if helpful. "
+    "For web results, include reputable sources with titles and URLs. "
+    "For code, print concise, human-readable outputs."
+)
 
 executor_agent = Agent(
     name="Executor",
-    instructions=(
-        "Execute provided task. Use tools if helpful. "
-        "For web results, include reputable sources with titles and URLs. "
-        "For code, print concise, human-readable outputs."
-    ),
+    instructions=EXECUTOR_PROMPT,
     model=DEFAULT_MODEL,
     model_settings=DEFAULT_MODEL_SETTINGS,
-    tools=BASE_TOOLS,
+    tools=list(BASE_TOOLS),
     hooks=EventPublishingHook(),
 )
 
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
-from agents import Agent
+from agents import Agent, AgentOutputSchema, ModelSettings
 from agentic.core.hooks import EventPublishingHook
 
 class PlanStep(BaseModel):
@@ -11,6 +11,10 @@ class PlanStep(BaseModel):
         default=None,
         description="Optional hint: 'web_search' | 'code' | 'none'"
     )
+    depends_on: List[int] = Field(
+        default_factory=list,
+        description="Ids of steps whose results this step needs; empty if it can run immediately"
+    )
 
 class TaskPlan(BaseModel):
     steps: List[PlanStep]
@@ -22,13 +26,16 @@ Keep each step crisp, focused on a deliverable. Make the smallest number of step
 Return plan as numbered list of actions containing the following fields:
 Goal: str
 Deliverable: str
+Depends on: list of step ids whose results are needed first (leave empty when the step is independent, so it can run in parallel)
 """.strip()
 
 planner_agent = Agent(
     name="Planner",
     instructions=PLANNER_PROMPT,
     model='gpt-4.1',
-    output_type=TaskPlan,
+    model_settings=ModelSettings(extra_args={"prompt_cache_key": "library-planner"}),
+    # Built once here; given a bare type, the SDK rebuilds the schema (TypeAdapter + JSON schema) every turn
+    output_type=AgentOutputSchema(TaskPlan),
     hooks=EventPublishingHook(),
 )
 
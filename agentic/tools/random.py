@@ -1,12 +1,12 @@
+from random import randint
 from typing import Any
 from agents import function_tool, RunContextWrapper
 from agentic.core.hooks import emit_agent_event
 
 @function_tool
 async def random_number(ctx: RunContextWrapper[Any], max: int) -> int:
-    import random
     """Generate a random number from 0 to max (inclusive)."""
-    value = random.randint(0, max)
+    value = randint(0, max)
     await emit_agent_event(
         ctx,
         source="random_number_tool",
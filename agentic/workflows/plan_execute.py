@@ -9,7 +9,14 @@ from agentic.library.planner import planner_tool
 from agentic.library.executor import executor_tool, BASE_TOOLS
 
 DEFAULT_MODEL = 'gpt-5.1'
-DEFAULT_MODEL_SETTINGS = ModelSettings(tool_choice="auto")
+# Independent plan steps are issued as parallel executor tool calls, which the SDK runs concurrently.
+# A stable prompt_cache_key routes every run to the same provider cache, so the fixed
+# instructions + tool prefix is reused across runs instead of only within one run.
+DEFAULT_MODEL_SETTINGS = ModelSettings(
+    tool_choice="auto",
+    parallel_tool_calls=True,
+    extra_args={"prompt_cache_key": "plan-execute-manager"},
+)
 
 MANAGER_PROMPT = """
 You are a helpful assistant, who is responsible for helping the user in the most efficient way without being annoying.
@@ -22,7 +29,7 @@ Approach:
 - Finish with a concise response that includes a summary paragraph, a few bullet highlights, and a short citations section.
 
 Parallel tool calls:
-- Analyse the plan to determine if steps can be executed concurrently
+- Analyse the plan to determine if steps can be executed concurrently: steps with no unfinished dependencies (depends_on) can run together
 - Call tools in parallel where possible to speed up completion
 - Use executor or concurrent tool calls to work out the answer
 
@@ -30,6 +37,8 @@ Outputs:
 - Provide a natural response to the initial user query, do not mention the process or planning steps you took to get there.
 """.strip()
 
+MANAGER_TOOLS = (*BASE_TOOLS, planner_tool, executor_tool, random_number)
+
 # Manager Agent defined locally as it's specific to this workflow
 manager_agent = Agent(
     name="Manager",
@@ -37,17 +46,16 @@ manager_agent = Agent(
     model=DEFAULT_MODEL,
     model_settings=DEFAULT_MODEL_SETTINGS,
     hooks=EventPublishingHook(),
-    tools=[*BASE_TOOLS, planner_tool, executor_tool, random_number],
+    tools=list(MANAGER_TOOLS),
 )
 
-async def run_plan_execute(
+def run_plan_execute(
     prompt: str, 
     event_publisher: Optional[EventPublisher] = None
 ) -> AsyncIterator[str]:
-    
-    async for chunk in stream_agent_output(
+    # Return the stream directly rather than re-yielding it, avoiding an extra generator hop per chunk
+    return stream_agent_output(
         manager_agent, 
         prompt, 
-        event_publisher=event_publisher
-    ):
-        yield chunk
+        event_publisher=event_publisher,
+    )
@@ -1,9 +1,35 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
+from agents.items import ModelResponse
 from nicegui import ui
 from agentic.core.events import AgentEvent
 
+MAX_VALUE_CHARS = 300  # per payload value in a log line
+
+def _format_str(value: str) -> str:
+    # Cut before repr so long tool results are not escaped in full just to be truncated
+    if len(value) > MAX_VALUE_CHARS:
+        return repr(value[:MAX_VALUE_CHARS]) + "…"
+    return repr(value)
+
+def _format_model_response(response: ModelResponse) -> str:
+    # Sent with every llm_ended event; its repr would be the whole model output
+    usage = getattr(response.usage, "total_tokens", "?")
+    return f"ModelResponse(output={len(response.output)}, tokens={usage})"
+
+# Exact-type fast paths for the most common payload values (strings, numbers, flags);
+# SDK objects that are large to serialise get a short summary;
+# everything else falls through to the attribute checks in _stringify
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: _format_str,
+    int: repr,
+    float: repr,
+    bool: repr,
+    type(None): repr,
+    ModelResponse: _format_model_response,
+}
+
 class AgentLogger(ui.log):
     """Component for logging agent events to a NiceGUI log element."""
     
@@ -11,18 +37,29 @@ class AgentLogger(ui.log):
         super().__init__(max_lines=max_lines)
 
     def _stringify(self, value: Any) -> str:
+        formatter = _FORMATTERS.get(value.__class__)
+        if formatter is not None:
+            return formatter(value)
         if hasattr(value, "name"):
             return f"{value.__class__.__name__}(name={getattr(value, 'name', 'unknown')})"
+        if isinstance(value, (list, tuple)):
+            # e.g. input_items: the whole conversation so far, re-sent on every LLM call
+            return f"{value.__class__.__name__}(len={len(value)})"
         if hasattr(value, "model_dump_json"):
-            return value.model_dump_json()
-        return repr(value)
+            text = value.model_dump_json()
+        else:
+            text = repr(value)
+        if len(text) > MAX_VALUE_CHARS:
+            return text[:MAX_VALUE_CHARS] + "…"
+        return text
 
     def format_event_line(self, event: AgentEvent) -> str:
         if event.data:
             details = ", ".join(f"{key}={self._stringify(value)}" for key, value in event.data.items())
         else:
             details = "no payload"
-        timestamp = event.timestamp.astimezone().strftime("%H:%M:%S")
+        local_time = event.timestamp.astimezone()
+        timestamp = f"{local_time.hour:02d}:{local_time.minute:02d}:{local_time.second:02d}"
         rest = f"{event.event_type} | {details}"
         return f"{timestamp} [{event.source}] {rest}"
 
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import asyncio
+import logging
 from typing import Dict, List, Optional, Any
 from nicegui import ui
 from agentic.core.events import AgentEvent
@@ -16,6 +18,23 @@ from .tool_code_interpreter import CodeInterpreterEventHandler, CodeInterpreterR
 from .tool_generic import GenericToolEventHandler, GenericToolRenderer
 from .lifecycle import LifecycleEventHandler, FinishedRenderer
 
+logger = logging.getLogger(__name__)
+
+# Step re-renders are deferred by this long so that several events touching the same step
+# (e.g. tool started + tool ended) rebuild its UI once
+STEP_UI_FLUSH_DELAY = 0.02
+
+# Hosted tool events are shown whichever agent emitted them (to support sub-agents)
+_GLOBAL_EVENT_TYPES = frozenset({"tool_web_search_event", "tool_code_interpreter_event"})
+
+
+def _same_render_state(old: tuple, new: tuple) -> bool:
+    try:
+        return old == new
+    except Exception:
+        # Payload values with unusual __eq__ (e.g. array-likes); just re-render
+        return False
+
 
 class ProgressItem(ui.item):
     """Timeline-style list item: dot + vertical line + free-form content."""
@@ -31,8 +50,8 @@ class ProgressItem(ui.item):
                         ui.icon('sym_o_checklist_rtl').classes('text-xl text-gray-500 mt-[2px]')
                     else:
                         with ui.row().classes('h-5 items-center justify-center'):
-                            ui.element('div').classes('h-[6px] w-[6px] rounded-full bg-gray-400')
-                        ui.element('div').classes('w-[1px] rounded-full grow bg-gray-300')
+                            ui.element('div').classes('step-rail-dot')
+                        ui.element('div').classes('step-rail-line')
 
                 # RIGHT CONTENT (free-form)
                 self.container = ui.column().classes('grow min-w-0 gap-2')
@@ -54,6 +73,8 @@ class AgentStepper(ui.list):
         # Initialize Context State
         self.steps: List[Step] = []
         self._main_agent_name: Optional[str] = None
+        # Kept across events (its lookup indexes must persist); rebuilt when the steps are reset
+        self._context: Optional[EventContext] = None
         self.tool_title_map = tool_title_map or {}
         
         # Register Default Tools
@@ -61,6 +82,8 @@ class AgentStepper(ui.list):
         
         # UI State
         self.step_ui_map: Dict[str, Any] = {} 
+        self._dirty_steps: Dict[str, Step] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         self.props('dense').classes('w-full max-w-xl gap-0 p-0')
         
         with self:
@@ -109,8 +132,10 @@ class AgentStepper(ui.list):
         if event.event_type == "agent_started_stream_event":
             if not self._main_agent_name:
                 self._main_agent_name = event.source
+                self._context = None
                 self.body_container.clear()
                 self.step_ui_map.clear()
+                self._dirty_steps.clear()
                 self.steps.clear()
             
             # Update header for start
@@ -122,12 +147,13 @@ class AgentStepper(ui.list):
         # Check main agent filter for non-global events
         # This mimics the original logic: "For other events, strictly filter by main agent"
         # We might want to move this into specific handlers later, but keeping it here for safety
-        is_global_event = event.event_type in ["tool_web_search_event", "tool_code_interpreter_event"]
+        is_global_event = event.event_type in _GLOBAL_EVENT_TYPES
         if self._main_agent_name and event.source != self._main_agent_name and not is_global_event:
             return
 
-        # Create Context
-        context = EventContext(self.steps, self._main_agent_name, self.tool_title_map)
+        context = self._context
+        if context is None:
+            context = self._context = EventContext(self.steps, self._main_agent_name, self.tool_title_map)
         
         # Delegate to Handlers
         handlers = self.event_registry.get_handlers(event)
@@ -162,16 +188,39 @@ class AgentStepper(ui.list):
             self.status_label.classes(remove='shimmer')
 
     def _update_step_ui(self, step: Step) -> None:
+        # Mark dirty and render on the next flush; dict keeps new steps in creation order
+        self._dirty_steps[step.id] = step
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(STEP_UI_FLUSH_DELAY, self._flush_step_ui)
+
+    def _flush_step_ui(self) -> None:
+        self._flush_handle = None
+        if self.is_deleted:
+            return
+        dirty_steps, self._dirty_steps = self._dirty_steps, {}
+        for step in dirty_steps.values():
+            # Runs from a loop callback: contain a failing renderer so the other steps still render
+            try:
+                self._render_step(step)
+            except Exception:
+                logger.exception("Failed to render step %s", step.id)
+
+    def _render_step(self, step: Step) -> None:
+        # Everything a renderer reads; holding the data values (not their hashes) keeps the comparison exact
+        render_state = (step.type, step.status, step.title, tuple(step.data.items()))
         if step.id in self.step_ui_map:
-            container, item = self.step_ui_map[step.id]
+            container, item, last_state = self.step_ui_map[step.id]
+            if _same_render_state(last_state, render_state):
+                return
             container.clear()
             self._render_step_content(step, container)
+            self.step_ui_map[step.id] = (container, item, render_state)
         else:
             with self.body_container:
                 # Check if it's a finished step to pass final=True
                 is_final = step.type == StepType.FINISHED
                 item = ProgressItem(final=is_final)
-                self.step_ui_map[step.id] = (item.container, item)
+                self.step_ui_map[step.id] = (item.container, item, render_state)
                 self._render_step_content(step, item.container)
 
     def _render_step_content(self, step: Step, container: ui.element) -> None:
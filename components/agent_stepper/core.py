@@ -1,7 +1,8 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Type, TYPE_CHECKING
+from typing import Any, Deque, Dict, List, Mapping, Optional, Protocol, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nicegui import ui
@@ -26,7 +27,7 @@ class StepStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     id: str
     type: StepType
@@ -44,6 +45,16 @@ class Step:
 # Context & Helpers
 # ==============================================================================
 
+# Friendly mapping for known tools
+DEFAULT_TOOL_TITLES: Dict[str, str] = {
+    "search_web": "Searching the web",
+    "execute_step": "Executing step",
+    "draft_plan": "Drafting plan",
+    "read_file": "Reading file",
+    "write_file": "Writing file",
+    "list_dir": "Listing directory",
+}
+
 class EventContext:
     """
     Helper context passed to event handlers.
@@ -54,45 +65,71 @@ class EventContext:
         self.main_agent_name = main_agent_name
         self.tool_title_map = tool_title_map
         self._step_counter = len(steps)
-
-    def create_step(self, type: StepType, title: str, data: Dict[str, Any] = None, span_id: str = None) -> Step:
+        # Lookup indexes so handlers don't scan every step per event. Entries are checked on
+        # lookup (status can be changed by any handler), so stale ones are simply skipped.
+        self._steps_by_span_id: Dict[Optional[str], List[Step]] = {}
+        self._pending_by_tool: Dict[str, Deque[Step]] = {}
+        # Titles only depend on the tool name, so resolve each one once
+        self._tool_titles: Dict[str, str] = {}
+        for step in steps:
+            self.index_span_id(step)
+            if step.type == StepType.TOOL and step.status == StepStatus.PENDING:
+                self.index_pending_tool(step)
+
+    def create_step(self, type: StepType, title: str, data: Mapping[str, Any] = None, span_id: str = None) -> Step:
         self._step_counter += 1
-        return Step(
+        step = Step(
             id=f"step_{self._step_counter}",
             type=type,
             title=title,
             status=StepStatus.RUNNING,
             span_id=span_id,
-            data=data or {}
+            # Copy so step updates never mutate the (shared, read-only) event payload
+            data=dict(data) if data else {}
         )
+        self.index_span_id(step)
+        return step
+
+    def index_span_id(self, step: Step) -> None:
+        """Register the step under its (possibly newly assigned) span_id."""
+        self._steps_by_span_id.setdefault(step.span_id, []).append(step)
+
+    def index_pending_tool(self, step: Step) -> None:
+        """Register a PENDING tool step so find_pending_tool_step can claim it."""
+        self._pending_by_tool.setdefault(step.data.get("tool_name"), deque()).append(step)
 
     def get_last_step(self) -> Optional[Step]:
         return self.steps[-1] if self.steps else None
 
     def find_step_by_span_id(self, span_id: str) -> Optional[Step]:
         # Search in reverse to find the most recent one
-        return next((s for s in reversed(self.steps) if s.span_id == span_id and s.status == StepStatus.RUNNING), None)
+        candidates = self._steps_by_span_id.get(span_id, ())
+        return next((s for s in reversed(candidates) if s.span_id == span_id and s.status == StepStatus.RUNNING), None)
 
     def find_pending_tool_step(self, tool_name: str) -> Optional[Step]:
-        return next((s for s in self.steps if s.type == StepType.TOOL and s.status == StepStatus.PENDING and s.data.get("tool_name") == tool_name), None)
+        queue = self._pending_by_tool.get(tool_name)
+        while queue:
+            step = queue[0]
+            if step.type == StepType.TOOL and step.status == StepStatus.PENDING and step.data.get("tool_name") == tool_name:
+                return step
+            # No longer pending; drop it for good
+            queue.popleft()
+        return None
 
     def get_tool_title(self, tool_name: str) -> str:
+        title = self._tool_titles.get(tool_name)
+        if title is None:
+            title = self._tool_titles[tool_name] = self._resolve_tool_title(tool_name)
+        return title
+
+    def _resolve_tool_title(self, tool_name: str) -> str:
         # Check custom map first
         if tool_name in self.tool_title_map:
             return self.tool_title_map[tool_name]
 
-        # Friendly mapping for known tools
-        mapping = {
-            "search_web": "Searching the web",
-            "execute_step": "Executing step",
-            "draft_plan": "Drafting plan",
-            "read_file": "Reading file",
-            "write_file": "Writing file",
-            "list_dir": "Listing directory",
-        }
         # Check exact match first
-        if tool_name in mapping:
-            return mapping[tool_name]
+        if tool_name in DEFAULT_TOOL_TITLES:
+            return DEFAULT_TOOL_TITLES[tool_name]
         
         # Check partial match for search
         if "search" in tool_name.lower():
@@ -108,6 +145,7 @@ class EventContext:
 
 class EventHandler(Protocol):
     def can_handle(self, event: AgentEvent) -> bool:
+        """Must depend only on event.event_type; the registry caches the answer per type."""
         ...
 
     def handle(self, event: AgentEvent, context: EventContext) -> List[Step]:
@@ -115,6 +153,9 @@ class EventHandler(Protocol):
 
 
 class StepRenderer(Protocol):
+    # Optional: (step type, data["tool_type"] or None) this renderer handles, for O(1) lookup
+    dispatch_key: Tuple[StepType, Optional[str]]
+
     def can_handle(self, step: Step) -> bool:
         ...
 
@@ -129,25 +170,44 @@ class StepRenderer(Protocol):
 class EventHandlerRegistry:
     def __init__(self):
         self._handlers: List[EventHandler] = []
+        # event_type -> matching handlers, filled on first sight of each type
+        self._dispatch_cache: Dict[str, List[EventHandler]] = {}
 
     def register(self, handler: EventHandler):
         self._handlers.append(handler)
+        self._dispatch_cache.clear()
 
     def get_handlers(self, event: AgentEvent) -> List[EventHandler]:
-        return [h for h in self._handlers if h.can_handle(event)]
+        handlers = self._dispatch_cache.get(event.event_type)
+        if handlers is None:
+            handlers = self._dispatch_cache[event.event_type] = [h for h in self._handlers if h.can_handle(event)]
+        return handlers
 
 
 class RendererRegistry:
     def __init__(self):
         self._renderers: List[StepRenderer] = []
+        # Only used while every renderer declares a dispatch_key; any custom can_handle logic
+        # without one falls back to the priority-ordered scan
+        self._by_key: Optional[Dict[Tuple[StepType, Optional[str]], StepRenderer]] = {}
 
     def register(self, renderer: StepRenderer, priority: int = 0):
         # Store as tuple (priority, renderer) to sort
         # Higher priority first
         self._renderers.append((priority, renderer))
         self._renderers.sort(key=lambda x: x[0], reverse=True)
+        self._by_key = {}
+        for _, registered in self._renderers:
+            key = getattr(registered, "dispatch_key", None)
+            if key is None:
+                self._by_key = None
+                break
+            self._by_key.setdefault(key, registered)
 
     def get_renderer(self, step: Step) -> Optional[StepRenderer]:
+        if self._by_key is not None:
+            renderer = self._by_key.get((step.type, step.data.get("tool_type")))
+            return renderer or self._by_key.get((step.type, None))
         for _, renderer in self._renderers:
             if renderer.can_handle(step):
                 return renderer
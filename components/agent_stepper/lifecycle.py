@@ -31,6 +31,8 @@ class LifecycleEventHandler(EventHandler):
 # ==============================================================================
 
 class FinishedRenderer(StepRenderer):
+    dispatch_key = (StepType.FINISHED, None)
+
     def can_handle(self, step: Step) -> bool:
         return step.type == StepType.FINISHED
 
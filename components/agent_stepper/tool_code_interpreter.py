@@ -1,11 +1,20 @@
 from __future__ import annotations
 from typing import List, TYPE_CHECKING
 from nicegui import ui
+from openai.types.responses.response_code_interpreter_tool_call import OutputImage, OutputLogs
 from .core import EventHandler, StepRenderer, EventContext, Step, StepType, StepStatus
 
 if TYPE_CHECKING:
     from agentic.core.events import AgentEvent
 
+# Longest output text pushed to the client per output; the rest is elided
+MAX_OUTPUT_CHARS = 8192
+
+def truncate_output(text: str, limit: int = MAX_OUTPUT_CHARS) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f"\n… [truncated, {len(text) - limit} chars]"
+
 # ==============================================================================
 # Event Handler
 # ==============================================================================
@@ -37,6 +46,8 @@ class CodeInterpreterEventHandler(EventHandler):
 # ==============================================================================
 
 class CodeInterpreterRenderer(StepRenderer):
+    dispatch_key = (StepType.TOOL, "code_interpreter")
+
     def can_handle(self, step: Step) -> bool:
         return step.type == StepType.TOOL and step.data.get("tool_type") == "code_interpreter"
 
@@ -48,14 +59,14 @@ class CodeInterpreterRenderer(StepRenderer):
                 ui.label(step.title).classes('text-gray-700 font-medium')
                 
             # Card Container
-            with ui.column().classes('w-full border border-gray-200 rounded-lg overflow-hidden gap-0'):
+            with ui.column().classes('step-card'):
                 
                 # Code Section (Arguments)
                 code = step.data.get('code', '')
                 if code:
                     with ui.column().classes('w-full p-2 bg-gray-50/50'):
-                        ui.label("Code").classes('text-xs text-gray-500 font-medium')
-                        ui.markdown(f"```python\n{code}\n```").classes('w-full text-xs text-gray-700 font-mono [&_pre]:whitespace-pre-wrap [&_pre]:bg-transparent [&_pre]:p-0')
+                        ui.label("Code").classes('step-section-label')
+                        ui.markdown(f"```python\n{code}\n```").classes('code-block')
                 
                 # Separator
                 if code:
@@ -63,7 +74,7 @@ class CodeInterpreterRenderer(StepRenderer):
 
                 # Output Section
                 with ui.column().classes('w-full p-2 bg-white'):
-                    ui.label("Output").classes('text-xs text-gray-500 font-medium')
+                    ui.label("Output").classes('step-section-label')
                     
                     outputs = step.data.get('outputs')
                     if outputs:
@@ -71,17 +82,18 @@ class CodeInterpreterRenderer(StepRenderer):
                             # Handle different output types
                             content = ""
                             if isinstance(output, str):
-                                content = output
-                            elif hasattr(output, 'logs') and output.logs:
-                                content = output.logs
-                            elif hasattr(output, 'image') and output.image:
+                                content = truncate_output(output)
+                            elif isinstance(output, OutputLogs):
+                                content = truncate_output(output.logs)
+                            elif isinstance(output, OutputImage):
                                 ui.label("[Image Output]").classes('text-gray-500 italic text-xs')
                                 continue
                             else:
-                                content = str(output)
+                                # repr rather than str: some objects have an expensive __str__
+                                content = truncate_output(repr(output))
                                 
                             if content:
-                                ui.markdown(f"```\n{content}\n```").classes('w-full text-xs text-gray-700 font-mono max-h-60 overflow-y-auto [&_pre]:whitespace-pre-wrap [&_pre]:bg-transparent [&_pre]:p-0')
+                                ui.markdown(f"```\n{content}\n```").classes('code-block max-h-60 overflow-y-auto')
                     else:
                         if step.status == StepStatus.RUNNING:
                              ui.label("...").classes('text-sm text-gray-400 italic')
@@ -1,104 +1,155 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
-import json
+from typing import Any, List, Tuple, TYPE_CHECKING
+import orjson
 from nicegui import ui
 from .core import EventHandler, StepRenderer, EventContext, Step, StepType, StepStatus
 
 if TYPE_CHECKING:
     from agentic.core.events import AgentEvent
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _pretty_json(value: Any) -> str:
+    return orjson.dumps(value, option=_JSON_OPTIONS).decode()
+
+
+def format_tool_call(tool_name: str, arguments: Any) -> str:
+    """Render a call as ``name({...})`` with pretty-printed JSON arguments when possible."""
+    try:
+        if isinstance(arguments, str):
+            parsed = orjson.loads(arguments)
+            # If it's a dict, format it nicely inside the function call
+            args_str = _pretty_json(parsed)
+            return f"{tool_name}({args_str})"
+    except:
+        pass
+    return f"{tool_name}({str(arguments)})"
+
+
+def format_tool_result(result: Any) -> Tuple[str, str]:
+    """Return (text, code block language) for a tool result, pretty-printing JSON."""
+    # Try to format JSON results nicely
+    try:
+        if isinstance(result, str):
+            # Try to parse string as JSON
+            parsed = orjson.loads(result)
+            return _pretty_json(parsed), 'json'
+        elif isinstance(result, (dict, list)):
+            return _pretty_json(result), 'json'
+    except:
+        pass
+    return str(result), ''
+
+
 # ==============================================================================
 # Event Handler
 # ==============================================================================
 
 class GenericToolEventHandler(EventHandler):
     def can_handle(self, event: AgentEvent) -> bool:
-        return event.event_type in ["tool_call_detected_event", "tool_started_stream_event", "tool_ended_stream_event"]
+        return event.event_type in self._HANDLERS
 
     def handle(self, event: AgentEvent, context: EventContext) -> List[Step]:
-        affected_steps = []
-
-        if event.event_type == "tool_call_detected_event":
-            # Create a PENDING step for the tool call
-            tool_name = event.data.get("tool_name", "Unknown Tool")
-            title = context.get_tool_title(tool_name)
-            
-            step = context.create_step(
-                StepType.TOOL, 
-                title, 
-                data={
-                    "tool_type": "generic",
-                    "tool_name": tool_name,
-                    "arguments": event.data.get("arguments"),
-                    "call_id": event.data.get("tool_call_id")
-                }
-            )
-            step.status = StepStatus.PENDING
+        handler = self._HANDLERS.get(event.event_type)
+        return handler(self, event, context) if handler else []
+
+    def _on_detected(self, event: AgentEvent, context: EventContext) -> List[Step]:
+        # Create a PENDING step for the tool call
+        tool_name = event.data.get("tool_name", "Unknown Tool")
+        title = context.get_tool_title(tool_name)
+        arguments = event.data.get("arguments")
+        
+        step = context.create_step(
+            StepType.TOOL, 
+            title, 
+            data={
+                "tool_type": "generic",
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "call_id": event.data.get("tool_call_id"),
+                # Formatted once here rather than on every re-render
+                "_display_code": format_tool_call(tool_name, arguments) if arguments else None,
+            }
+        )
+        step.status = StepStatus.PENDING
+        context.steps.append(step)
+        context.index_pending_tool(step)
+        return [step]
+
+    def _on_started(self, event: AgentEvent, context: EventContext) -> List[Step]:
+        # If the last step is already a "Running code" step (created by tool_code_interpreter_event),
+        # we don't want to create a duplicate generic tool step.
+        last_step = context.get_last_step()
+        if last_step and last_step.data.get("tool_type") == "code_interpreter" and last_step.status == StepStatus.RUNNING:
+            return []
+
+        tool_name = "Unknown Tool"
+        if event.data and "tool" in event.data:
+            tool = event.data["tool"]
+            if hasattr(tool, "name"):
+                tool_name = tool.name
+            elif isinstance(tool, dict):
+                tool_name = tool.get("name", "Unknown Tool")
+        
+        title = context.get_tool_title(tool_name)
+        
+        # Check for existing PENDING step for this tool
+        existing_step = context.find_pending_tool_step(tool_name)
+        
+        if existing_step:
+            step = existing_step
+            step.status = StepStatus.RUNNING
+            step.span_id = event.span_id
+            context.index_span_id(step)
+            # Merge data (keep arguments)
+            step.data.update(event.data)
+        else:
+            step = context.create_step(StepType.TOOL, title, data=event.data, span_id=event.span_id)
             context.steps.append(step)
-            affected_steps.append(step)
-
-        elif event.event_type == "tool_started_stream_event":
-            # If the last step is already a "Running code" step (created by tool_code_interpreter_event),
-            # we don't want to create a duplicate generic tool step.
+        
+        return [step]
+
+    def _on_ended(self, event: AgentEvent, context: EventContext) -> List[Step]:
+        # Find step by span_id if available
+        target_step = context.find_step_by_span_id(event.span_id)
+        
+        # Fallback to last running tool step if no span_id match
+        if not target_step:
             last_step = context.get_last_step()
-            if last_step and last_step.data.get("tool_type") == "code_interpreter" and last_step.status == StepStatus.RUNNING:
-                # Just update the title if needed, or ignore
-                pass
-            else:
-                tool_name = "Unknown Tool"
-                if event.data and "tool" in event.data:
-                    tool = event.data["tool"]
-                    if hasattr(tool, "name"):
-                        tool_name = tool.name
-                    elif isinstance(tool, dict):
-                        tool_name = tool.get("name", "Unknown Tool")
-                
-                title = context.get_tool_title(tool_name)
-                
-                # Check for existing PENDING step for this tool
-                existing_step = context.find_pending_tool_step(tool_name)
-                
-                if existing_step:
-                    step = existing_step
-                    step.status = StepStatus.RUNNING
-                    step.span_id = event.span_id
-                    # Merge data (keep arguments)
-                    step.data.update(event.data)
-                else:
-                    step = context.create_step(StepType.TOOL, title, data=event.data, span_id=event.span_id)
-                    context.steps.append(step)
-                
-                affected_steps.append(step)
-
-        elif event.event_type == "tool_ended_stream_event":
-            # Find step by span_id if available
-            target_step = context.find_step_by_span_id(event.span_id)
+            if last_step and last_step.type == StepType.TOOL and last_step.status == StepStatus.RUNNING:
+                target_step = last_step
+
+        if not target_step:
+            return []
+
+        target_step.status = StepStatus.COMPLETED
+        if event.data:
+            # Update data with result
+            target_step.data.update(event.data)
+            if "result" in event.data:
+                target_step.data["_display_result"] = format_tool_result(event.data["result"])
             
-            # Fallback to last running tool step if no span_id match
-            if not target_step:
-                last_step = context.get_last_step()
-                if last_step and last_step.type == StepType.TOOL and last_step.status == StepStatus.RUNNING:
-                    target_step = last_step
-
-            if target_step:
-                target_step.status = StepStatus.COMPLETED
-                if event.data:
-                    # Update data with result
-                    target_step.data.update(event.data)
-                    
-                    # If this was a code interpreter step, ensure 'outputs' is populated from 'result' if needed
-                    if target_step.data.get("tool_type") == "code_interpreter":
-                        result = event.data.get("result")
-                        # If we didn't have outputs before, use result
-                        if result:
-                            if not target_step.data.get("outputs"):
-                                target_step.data["outputs"] = [result]
-                            elif isinstance(target_step.data["outputs"], list) and result not in target_step.data["outputs"]:
-                                target_step.data["outputs"].append(result)
-                            
-                affected_steps.append(target_step)
-
-        return affected_steps
+            # If this was a code interpreter step, ensure 'outputs' is populated from 'result' if needed
+            if target_step.data.get("tool_type") == "code_interpreter":
+                result = event.data.get("result")
+                # If we didn't have outputs before, use result
+                if result:
+                    if not target_step.data.get("outputs"):
+                        target_step.data["outputs"] = [result]
+                    elif isinstance(target_step.data["outputs"], list) and result not in target_step.data["outputs"]:
+                        # New list rather than append: the old one is the event's (shared) payload,
+                        # and a new object is what marks the step as changed for re-rendering
+                        target_step.data["outputs"] = [*target_step.data["outputs"], result]
+
+        return [target_step]
+
+    # One lookup per event instead of an if/elif chain of string compares
+    _HANDLERS = {
+        "tool_call_detected_event": _on_detected,
+        "tool_started_stream_event": _on_started,
+        "tool_ended_stream_event": _on_ended,
+    }
 
 
 # ==============================================================================
@@ -106,6 +157,8 @@ class GenericToolEventHandler(EventHandler):
 # ==============================================================================
 
 class GenericToolRenderer(StepRenderer):
+    dispatch_key = (StepType.TOOL, None)
+
     def __init__(self, hidden_tool_details: List[str] = None):
         self.hidden_tool_details = hidden_tool_details or []
 
@@ -131,32 +184,20 @@ class GenericToolRenderer(StepRenderer):
                     return
 
                 # Card Container
-                with ui.column().classes('w-full border border-gray-200 rounded-lg overflow-hidden gap-0'):
+                with ui.column().classes('step-card'):
                     
                     # Arguments Section
                     arguments = step.data.get('arguments')
                     if arguments:
                         with ui.column().classes('w-full p-2 bg-gray-50/50'):
-                            ui.label("Arguments").classes('text-xs text-gray-500 font-medium')
-                            
-                            tool_name = step.data.get('tool_name', 'tool')
+                            ui.label("Arguments").classes('step-section-label')
                             
-                            # Format arguments
-                            try:
-                                if isinstance(arguments, str):
-                                    parsed = json.loads(arguments)
-                                    # If it's a dict, format it nicely inside the function call
-                                    args_str = json.dumps(parsed, indent=2)
-                                    display_code = f"{tool_name}({args_str})"
-                                else:
-                                    display_code = f"{tool_name}({str(arguments)})"
-                            except:
-                                display_code = f"{tool_name}({str(arguments)})"
+                            display_code = step.data.get('_display_code') or format_tool_call(tool_name, arguments)
                                 
                             # Clean, light code block
                             # Changed language to javascript for better highlighting of function calls
                             # Removed break-all to prevent weird word breaking
-                            ui.markdown(f"```javascript\n{display_code}\n```").classes('w-full text-xs text-gray-700 font-mono [&_pre]:whitespace-pre-wrap [&_pre]:bg-transparent [&_pre]:p-0')
+                            ui.markdown(f"```javascript\n{display_code}\n```").classes('code-block')
                     
                     # Separator
                     if arguments:
@@ -164,29 +205,14 @@ class GenericToolRenderer(StepRenderer):
 
                     # Output Section
                     with ui.column().classes('w-full p-2 bg-white'):
-                        ui.label("Output").classes('text-xs text-gray-500 font-medium')
+                        ui.label("Output").classes('step-section-label')
                         
                         if step.status == StepStatus.COMPLETED:
                             result = step.data.get('result')
                             if result:
-                                # Try to format JSON results nicely
-                                try:
-                                    if isinstance(result, str):
-                                        # Try to parse string as JSON
-                                        parsed = json.loads(result)
-                                        result_str = json.dumps(parsed, indent=2)
-                                        lang = 'json'
-                                    elif isinstance(result, (dict, list)):
-                                        result_str = json.dumps(result, indent=2)
-                                        lang = 'json'
-                                    else:
-                                        result_str = str(result)
-                                        lang = ''
-                                except:
-                                    result_str = str(result)
-                                    lang = ''
+                                result_str, lang = step.data.get('_display_result') or format_tool_result(result)
                                     
-                                ui.markdown(f"```{lang}\n{result_str}\n```").classes('w-full text-xs text-gray-700 font-mono max-h-60 overflow-y-auto [&_pre]:whitespace-pre-wrap [&_pre]:bg-transparent [&_pre]:p-0')
+                                ui.markdown(f"```{lang}\n{result_str}\n```").classes('code-block max-h-60 overflow-y-auto')
                             else:
                                 ui.label("No output").classes('text-sm text-gray-500')
                         else:
@@ -12,30 +12,35 @@ if TYPE_CHECKING:
 
 class ThinkingEventHandler(EventHandler):
     def can_handle(self, event: AgentEvent) -> bool:
-        return event.event_type in ["llm_started_stream_event", "llm_ended_stream_event"]
+        return event.event_type in self._HANDLERS
 
     def handle(self, event: AgentEvent, context: EventContext) -> List[Step]:
-        affected_steps = []
+        handler = self._HANDLERS.get(event.event_type)
+        return handler(self, event, context) if handler else []
+
+    def _on_llm_started(self, event: AgentEvent, context: EventContext) -> List[Step]:
+        # Complete previous step if running
+        last_step = context.get_last_step()
+        if last_step and last_step.status == StepStatus.RUNNING:
+            last_step.status = StepStatus.COMPLETED
         
-        if event.event_type == "llm_started_stream_event":
-            # Complete previous step if running
-            last_step = context.get_last_step()
-            if last_step and last_step.status == StepStatus.RUNNING:
-                last_step.status = StepStatus.COMPLETED
-            
-            step = context.create_step(StepType.THINKING, "Thinking...", data=event.data)
-            context.steps.append(step)
-            affected_steps.append(step)
-
-        elif event.event_type == "llm_ended_stream_event":
-            last_step = context.get_last_step()
-            if last_step and last_step.type == StepType.THINKING:
-                last_step.status = StepStatus.COMPLETED
-                if event.data:
-                    last_step.data.update(event.data)
-                affected_steps.append(last_step)
-                
-        return affected_steps
+        step = context.create_step(StepType.THINKING, "Thinking...", data=event.data)
+        context.steps.append(step)
+        return [step]
+
+    def _on_llm_ended(self, event: AgentEvent, context: EventContext) -> List[Step]:
+        last_step = context.get_last_step()
+        if not last_step or last_step.type != StepType.THINKING:
+            return []
+        last_step.status = StepStatus.COMPLETED
+        if event.data:
+            last_step.data.update(event.data)
+        return [last_step]
+
+    _HANDLERS = {
+        "llm_started_stream_event": _on_llm_started,
+        "llm_ended_stream_event": _on_llm_ended,
+    }
 
 
 # ==============================================================================
@@ -43,6 +48,8 @@ class ThinkingEventHandler(EventHandler):
 # ==============================================================================
 
 class ThinkingRenderer(StepRenderer):
+    dispatch_key = (StepType.THINKING, None)
+
     def can_handle(self, step: Step) -> bool:
         return step.type == StepType.THINKING
 
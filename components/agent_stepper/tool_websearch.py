@@ -1,11 +1,61 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+from typing import Any, Iterable, List, Tuple, TYPE_CHECKING
+from html import escape
+import re
 from nicegui import ui
 from .core import EventHandler, StepRenderer, EventContext, Step, StepType, StepStatus
 
 if TYPE_CHECKING:
     from agentic.core.events import AgentEvent
 
+
+# Host part of an http(s) url, without a leading "www."
+_DOMAIN_RE = re.compile(r'^https?://(?:www\.)?([^/?#]+)')
+
+
+def _field(source: Any, name: str) -> Any:
+    # Sources are Pydantic models from the SDK, or plain dicts
+    value = getattr(source, name, None)
+    if value is None and isinstance(source, dict):
+        value = source.get(name)
+    return value
+
+
+def source_link(source: Any) -> Tuple[str, str, str]:
+    """Return (url, title, domain) for a web search source (model object or dict)."""
+    url = _field(source, 'url') or str(source)
+    title = _field(source, 'title') or url
+
+    # Domain extraction
+    match = _DOMAIN_RE.match(url) if isinstance(url, str) else None
+    domain = match.group(1) if match else ""
+    return url, title, domain
+
+
+_SOURCE_ROW_CLASSES = "flex items-center w-full gap-2 px-2 py-1 hover:bg-gray-50 transition-colors no-underline"
+
+
+def sources_html(sources: Iterable[Any]) -> str:
+    """Render the sources list as one HTML string; every value is escaped."""
+    rows = []
+    for source in sources:
+        url, title, domain = source_link(source)
+        row = (
+            '<i class="material-icons text-gray-400 text-xs shrink-0">public</i>'
+            f'<span class="text-xs text-gray-700 truncate font-medium grow min-w-0">{escape(str(title))}</span>'
+        )
+        if domain:
+            # Only http(s) urls (the ones with a domain) become links
+            row += f'<span class="text-[10px] text-gray-400 shrink-0">{escape(domain)}</span>'
+            rows.append(f'<a href="{escape(url)}" target="_blank" rel="noopener" class="{_SOURCE_ROW_CLASSES}">{row}</a>')
+        else:
+            rows.append(f'<div class="{_SOURCE_ROW_CLASSES}">{row}</div>')
+    return (
+        '<div class="w-full border border-gray-200 rounded-md mt-1 bg-white divide-y divide-gray-200">'
+        + ''.join(rows) + '</div>'
+    )
+
+
 # ==============================================================================
 # Event Handler
 # ==============================================================================
@@ -35,6 +85,8 @@ class WebSearchEventHandler(EventHandler):
 # ==============================================================================
 
 class WebSearchRenderer(StepRenderer):
+    dispatch_key = (StepType.TOOL, "web_search")
+
     def can_handle(self, step: Step) -> bool:
         return step.type == StepType.TOOL and step.data.get("tool_type") == "web_search"
 
@@ -58,49 +110,9 @@ class WebSearchRenderer(StepRenderer):
                 # "Reviewing sources" Header
                 with ui.row().classes('items-center gap-2 mt-2'):
                     ui.icon('library_books').classes('text-xs text-gray-500')
-                    ui.label(f"Reviewing sources").classes('text-xs text-gray-500 font-medium')
+                    ui.label(f"Reviewing sources").classes('step-section-label')
                     with ui.element('div').classes('bg-gray-200 px-1.5 rounded text-[10px] text-gray-600'):
                         ui.label(str(len(sources)))
 
-                # Sources List (Vertical List)
-                with ui.list().props('dense separator').classes('w-full border border-gray-200 rounded-md mt-1 bg-white'):
-                    for source in sources:
-                        # Robust Extraction Logic
-                        url = None
-                        title = None
-                        
-                        # 1. Try attribute access (Pydantic model)
-                        if hasattr(source, 'url'):
-                            url = source.url
-                        if hasattr(source, 'title'):
-                            title = source.title
-                            
-                        # 2. Try dict access
-                        if url is None and isinstance(source, dict):
-                            url = source.get('url')
-                        if title is None and isinstance(source, dict):
-                            title = source.get('title')
-                            
-                        # 3. Fallback
-                        if url is None: 
-                            url = str(source)
-                        if title is None: 
-                            title = url
-
-                        # Domain extraction
-                        domain = ""
-                        try:
-                            from urllib.parse import urlparse
-                            if url and url.startswith('http'):
-                                domain = urlparse(url).netloc.replace('www.', '')
-                        except:
-                            pass
-
-                        # List Item as Link
-                        with ui.item().props(f'tag="a" href="{url}" target="_blank" clickable dense').classes('hover:bg-gray-50 transition-colors text-decoration-none pl-2 pr-2'):
-                            with ui.item_section():
-                                with ui.row().classes('items-center w-full gap-2 no-wrap'):
-                                    ui.icon('public').classes('text-gray-400 text-xs shrink-0')
-                                    ui.label(title).classes('text-xs text-gray-700 truncate font-medium grow')
-                                    if domain:
-                                        ui.label(domain).classes('text-[10px] text-gray-400 shrink-0')
+                # Sources List: one html element instead of ~6 elements per source
+                ui.html(sources_html(sources), sanitize=False).classes('w-full')
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import re
+from typing import List, Tuple
+from nicegui import ui
+
+# Code fence lines as ui.markdown's fenced-code-blocks extra reads them: a run of 3+ backticks
+# at the start of a line, optionally followed by a language name
+_FENCE_RE = re.compile(r'^[ \t]*(`{3,})[ \t]*([\w+-]+)?[ \t]*$', re.MULTILINE)
+
+# First lines that continue the previous block (indented continuations, list items) or that
+# other blocks may refer to (reference/footnote definitions); a split before them changes the output
+_CONTINUATION_RE = re.compile(r'[ \t]|[-*+][ \t\n]|\d{1,9}[.)][ \t\n]|\[[^\]\n]*\]:')
+# Reference and footnote definitions resolve across the whole document
+_DEFINITION_RE = re.compile(r'^[ ]{0,3}\[[^\]\n]+\]:', re.MULTILINE)
+
+
+def _starts_new_block(text: str, start: int) -> bool:
+    """Whether the block starting at ``start`` can be rendered apart from everything before it."""
+    while start < len(text) and text[start] == "\n":
+        start += 1
+    end = text.find("\n", start)
+    if end == -1:
+        # Its first line is still streaming, so we can't tell what kind of block it is yet
+        return False
+    return not _CONTINUATION_RE.match(text, start)
+
+
+def _code_fences(text: str) -> List[Tuple[int, int]]:
+    """(start, end) spans of the fenced code blocks in ``text``; an unclosed fence runs to the end.
+
+    A fence closes on a bare line of at least as many backticks as opened it, so shorter runs
+    and inline backticks inside the block don't end it.
+    """
+    spans: List[Tuple[int, int]] = []
+    start, opener = -1, ""
+    for match in _FENCE_RE.finditer(text):
+        marker, language = match.groups()
+        if not opener:
+            start, opener = match.start(), marker
+        elif len(marker) >= len(opener) and not language:
+            spans.append((start, match.end()))
+            opener = ""
+    if opener:
+        spans.append((start, len(text)))
+    return spans
+
+
+def split_completed_blocks(text: str) -> Tuple[str, str]:
+    """Split streamed markdown into (completed blocks, unfinished tail).
+
+    A block is complete once a blank line follows it and the next block starts at column 0 as
+    something other than a list item or definition. Blank lines inside an open code fence, or
+    between list items and their continuations, are not boundaries. The completed part renders
+    the same on its own as inside the whole document, so it can be rendered once.
+    """
+    fences = _code_fences(text)
+    cut = text.rfind("\n\n")
+    while cut != -1:
+        in_fence = any(start < cut < end for start, end in fences)
+        if not in_fence and _starts_new_block(text, cut + 2):
+            return text[:cut], text[cut + 2:]
+        cut = text.rfind("\n\n", 0, cut)
+    return "", text
+
+
+class StreamingMarkdown(ui.column):
+    """Markdown view for streamed text that only re-renders the unfinished tail.
+
+    Completed blocks are frozen into their own markdown elements, so each update re-sends the
+    last block instead of the whole answer.
+    """
+
+    def __init__(self, content: str = "") -> None:
+        super().__init__()
+        self.classes('gap-0')
+        self._tail = ""
+        self._frozen: List[str] = []
+        self._tail_view: ui.markdown | None = None
+        self.set_content(content)
+
+    def set_content(self, content: str) -> None:
+        """Replace everything shown (placeholders, errors, the first streamed chunk)."""
+        self._frozen = []
+        self._freezing = True
+        self._reset_views()
+        self.append(content)
+
+    def _reset_views(self) -> None:
+        self.clear()
+        self._tail = ""
+        with self:
+            self._tail_view = ui.markdown()
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        text = self._tail + text
+        if self._freezing and _DEFINITION_RE.search(text):
+            # Earlier blocks may use these definitions: render the whole answer as one document from now on
+            text = "\n\n".join([*self._frozen, text])
+            self._frozen = []
+            self._freezing = False
+            self._reset_views()
+        if self._freezing:
+            completed, text = split_completed_blocks(text)
+            if completed:
+                # Render the finished blocks one last time and start a fresh element for the tail
+                self._frozen.append(completed)
+                self._tail_view.set_content(completed)
+                with self:
+                    self._tail_view = ui.markdown()
+        self._tail = text
+        self._tail_view.set_content(self._tail)
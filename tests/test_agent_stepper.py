@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import List
 from components.agent_stepper import (
     Step, StepType, StepStatus, EventContext, 
@@ -8,7 +9,11 @@ from components.agent_stepper import (
 # Import handlers directly for testing
 from components.agent_stepper.tool_thinking import ThinkingEventHandler
 from components.agent_stepper.tool_generic import GenericToolEventHandler
-from components.agent_stepper.lifecycle import LifecycleEventHandler
+from components.agent_stepper.lifecycle import LifecycleEventHandler, FinishedRenderer
+from components.agent_stepper.tool_code_interpreter import CodeInterpreterRenderer, truncate_output
+from components.agent_stepper.tool_generic import GenericToolRenderer
+from components.agent_stepper.tool_websearch import sources_html
+from components.agent_stepper import AgentStepper, RendererRegistry
 from agentic.core.events import AgentEvent
 
 def create_event(event_type: str, source: str = "Manager", **data) -> AgentEvent:
@@ -82,5 +87,129 @@ class TestAgentStepperLogic(unittest.TestCase):
         
         self.assertEqual(self.steps[0].title, "Running the Step")
 
+    def test_pending_tool_call_is_promoted_and_completed_by_span(self):
+        self.handle_event(create_event("tool_call_detected_event", tool_name="draft_plan", arguments="{}", tool_call_id="fc_1"))
+        self.handle_event(create_event("tool_call_detected_event", tool_name="draft_plan", arguments="{}", tool_call_id="fc_2"))
+        self.assertEqual([step.status for step in self.steps], [StepStatus.PENDING, StepStatus.PENDING])
+
+        started = create_event("tool_started_stream_event", tool={"name": "draft_plan"})
+        started.span_id = "span_a"
+        self.handle_event(started)
+
+        # The first pending call is claimed, the second stays pending
+        self.assertEqual(len(self.steps), 2)
+        self.assertEqual(self.steps[0].status, StepStatus.RUNNING)
+        self.assertEqual(self.steps[0].data["call_id"], "fc_1")
+        self.assertEqual(self.context.find_pending_tool_step("draft_plan"), self.steps[1])
+
+        ended = create_event("tool_ended_stream_event", tool={"name": "draft_plan"}, result="plan")
+        ended.span_id = "span_a"
+        self.handle_event(ended)
+        self.assertEqual(self.steps[0].status, StepStatus.COMPLETED)
+        self.assertEqual(self.steps[1].status, StepStatus.PENDING)
+
+    def test_tool_arguments_and_result_are_formatted_once_in_the_handler(self):
+        self.handle_event(create_event("tool_call_detected_event", tool_name="random_number", arguments='{"max": 10}', tool_call_id="fc_1"))
+        self.assertEqual(self.steps[0].data["_display_code"], 'random_number({\n  "max": 10\n})')
+
+        self.handle_event(create_event("tool_started_stream_event", tool={"name": "random_number"}))
+        self.handle_event(create_event("tool_ended_stream_event", tool={"name": "random_number"}, result='{"value": 7}'))
+        self.assertEqual(self.steps[0].data["_display_result"], ('{\n  "value": 7\n}', 'json'))
+
+    def test_step_data_is_copied_from_read_only_event_data(self):
+        event = create_event("tool_started_stream_event", tool={"name": "execute_step"})
+        event.data = MappingProxyType(dict(event.data))
+
+        self.handle_event(event)
+        self.handle_event(create_event("tool_ended_stream_event", result="Done"))
+
+        self.assertEqual(self.steps[0].data["result"], "Done")
+        self.assertNotIn("result", event.data)
+
+class TestEventHandlerRegistry(unittest.TestCase):
+    def test_handlers_are_cached_per_event_type_until_register(self):
+        registry = EventHandlerRegistry()
+        thinking = ThinkingEventHandler()
+        registry.register(thinking)
+
+        self.assertEqual(registry.get_handlers(create_event("llm_started_stream_event")), [thinking])
+        self.assertEqual(registry.get_handlers(create_event("tool_started_stream_event")), [])
+
+        generic = GenericToolEventHandler()
+        registry.register(generic)
+        self.assertEqual(registry.get_handlers(create_event("tool_started_stream_event")), [generic])
+
+class TestRendererRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = RendererRegistry()
+        self.code = CodeInterpreterRenderer()
+        self.generic = GenericToolRenderer()
+        self.finished = FinishedRenderer()
+        self.registry.register(self.code, priority=90)
+        self.registry.register(self.finished, priority=100)
+        self.registry.register(self.generic, priority=10)
+
+    def test_keyed_lookup_prefers_specific_tool_type(self):
+        code_step = Step(id="s1", type=StepType.TOOL, title="Running code", data={"tool_type": "code_interpreter"})
+        tool_step = Step(id="s2", type=StepType.TOOL, title="Drafting plan", data={"tool_type": "generic"})
+        finished_step = Step(id="s3", type=StepType.FINISHED, title="Finished")
+
+        self.assertIs(self.registry.get_renderer(code_step), self.code)
+        self.assertIs(self.registry.get_renderer(tool_step), self.generic)
+        self.assertIs(self.registry.get_renderer(finished_step), self.finished)
+
+    def test_renderer_without_dispatch_key_falls_back_to_priority_scan(self):
+        class TitleRenderer:
+            def can_handle(self, step):
+                return step.title == "Custom"
+
+            def render(self, step, container):
+                pass
+
+        custom = TitleRenderer()
+        self.registry.register(custom, priority=200)
+
+        custom_step = Step(id="s1", type=StepType.TOOL, title="Custom", data={"tool_type": "code_interpreter"})
+        self.assertIs(self.registry.get_renderer(custom_step), custom)
+
+class TestStepUiFlush(unittest.TestCase):
+    def test_failing_renderer_does_not_drop_other_steps(self):
+        class BrokenRenderer:
+            dispatch_key = (StepType.THINKING, None)
+
+            def can_handle(self, step):
+                return step.type == StepType.THINKING
+
+            def render(self, step, container):
+                raise RuntimeError("boom")
+
+        stepper = AgentStepper()
+        stepper.renderer_registry.register(BrokenRenderer(), priority=1000)
+        broken = Step(id="s1", type=StepType.THINKING, title="Thinking...")
+        finished = Step(id="s2", type=StepType.FINISHED, title="Finished")
+        stepper._dirty_steps = {broken.id: broken, finished.id: finished}
+
+        with self.assertLogs("components.agent_stepper.components", level="ERROR"):
+            stepper._flush_step_ui()
+
+        self.assertIn("s2", stepper.step_ui_map)
+        self.assertEqual(stepper._dirty_steps, {})
+
+class TestCodeInterpreterOutput(unittest.TestCase):
+    def test_long_output_is_truncated(self):
+        self.assertEqual(truncate_output("short", limit=10), "short")
+        self.assertEqual(truncate_output("x" * 15, limit=10), "x" * 10 + "\n… [truncated, 5 chars]")
+
+class TestWebSearchSources(unittest.TestCase):
+    def test_sources_are_rendered_as_escaped_links(self):
+        html = sources_html([
+            {"url": "https://www.example.com/?q=<b>", "title": "A & B"},
+            {"url": "javascript:alert(1)", "title": "not a link"},
+        ])
+        self.assertIn('href="https://www.example.com/?q=&lt;b&gt;"', html)
+        self.assertIn("A &amp; B", html)
+        self.assertIn("example.com</span>", html)
+        self.assertNotIn("javascript:", html)
+
 if __name__ == '__main__':
     unittest.main()
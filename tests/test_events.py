@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
+from typing import List
+import orjson
+from agentic.core.events import AgentEvent, EventPublisher
+
+def create_event(event_type: str, source: str = "Manager", **data) -> AgentEvent:
+    return AgentEvent(event_type=event_type, source=source, data=data)
+
+class TestEventPublisher(unittest.IsolatedAsyncioTestCase):
+    async def test_publish_event_reaches_sync_and_async_subscribers(self):
+        received: List[str] = []
+
+        async def async_subscriber(event: AgentEvent):
+            received.append(f"async:{event.event_type}")
+
+        def sync_subscriber(event: AgentEvent):
+            received.append(f"sync:{event.event_type}")
+
+        publisher = EventPublisher(subscribers=[async_subscriber, sync_subscriber])
+        await publisher.publish_event(create_event("llm_started_stream_event"))
+
+        self.assertCountEqual(received, ["async:llm_started_stream_event", "sync:llm_started_stream_event"])
+
+    async def test_failing_or_slow_subscriber_does_not_block_others(self):
+        received: List[str] = []
+
+        async def failing_subscriber(event: AgentEvent):
+            raise RuntimeError("boom")
+
+        async def slow_subscriber(event: AgentEvent):
+            await asyncio.sleep(10)
+
+        async def subscriber(event: AgentEvent):
+            received.append(event.event_type)
+
+        publisher = EventPublisher(subscribers=[failing_subscriber, slow_subscriber, subscriber], subscriber_timeout=0.01)
+        with self.assertLogs("agentic.core.events", level="ERROR"):
+            await publisher.enqueue_event(create_event("agent_started_stream_event"))
+            await publisher.flush()
+
+        self.assertEqual(received, ["agent_started_stream_event"])
+
+    async def test_single_failing_subscriber_is_logged(self):
+        async def failing_subscriber(event: AgentEvent):
+            raise RuntimeError("boom")
+
+        publisher = EventPublisher(subscribers=[failing_subscriber])
+        with self.assertLogs("agentic.core.events", level="ERROR"):
+            await publisher.publish_event(create_event("agent_started_stream_event"))
+
+    async def test_enqueued_events_are_delivered_in_order_on_flush(self):
+        received: List[int] = []
+
+        async def subscriber(event: AgentEvent):
+            received.append(event.data["index"])
+
+        publisher = EventPublisher(subscribers=[subscriber], max_batch=4)
+        for index in range(10):
+            await publisher.enqueue_event(create_event("tool_started_stream_event", index=index))
+
+        await publisher.flush()
+        self.assertEqual(received, list(range(10)))
+
+    async def test_enqueue_waits_when_buffer_is_full(self):
+        received: List[int] = []
+
+        async def subscriber(event: AgentEvent):
+            received.append(event.data["index"])
+
+        publisher = EventPublisher(subscribers=[subscriber], max_batch=2, max_pending=3, flush_delay=10)
+        for index in range(3):
+            await publisher.enqueue_event(create_event("tool_started_stream_event", index=index))
+
+        # Reaching max_pending forces a synchronous drain
+        self.assertEqual(received, [0, 1, 2])
+
+    async def test_enqueue_without_subscribers_does_not_buffer(self):
+        publisher = EventPublisher()
+        tasks_before = asyncio.all_tasks()
+        await publisher.enqueue_event(create_event("tool_started_stream_event"))
+        # No background delivery task is started, and flush has nothing to wait for
+        self.assertEqual(asyncio.all_tasks(), tasks_before)
+        await publisher.flush()
+
+    async def test_fire_and_forget_does_not_wait_for_subscribers(self):
+        release = asyncio.Event()
+        received: List[str] = []
+
+        async def slow_subscriber(event: AgentEvent):
+            await release.wait()
+            received.append(event.event_type)
+
+        publisher = EventPublisher(subscribers=[slow_subscriber], fire_and_forget=True)
+        await publisher.publish_event(create_event("agent_started_stream_event"))
+        self.assertEqual(received, [])
+
+        release.set()
+        await publisher.flush()
+        self.assertEqual(received, ["agent_started_stream_event"])
+
+class TestAgentEvent(unittest.TestCase):
+    def test_to_json_bytes_reduces_payload_objects(self):
+        event = AgentEvent(
+            timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            event_type="tool_started_stream_event",
+            source="Manager",
+            data=MappingProxyType({"agent": SimpleNamespace(name="Executor"), "result": "ok", "outputs": [1, 2]}),
+        )
+
+        payload = orjson.loads(event.to_json_bytes())
+
+        self.assertEqual(payload["timestamp"], "2025-01-01T00:00:00Z")
+        self.assertEqual(payload["data"], {"agent": "Executor", "result": "ok", "outputs": [1, 2]})
+
+if __name__ == '__main__':
+    unittest.main()
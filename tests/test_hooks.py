@@ -0,0 +1,62 @@
+import unittest
+from types import SimpleNamespace
+from typing import List
+import orjson
+from agents import RunContextWrapper
+from openai.types.responses.response_output_text import AnnotationURLCitation
+from agentic.core.events import AgentEvent, EventPublisher
+from agentic.core.hooks import EventPublishingHook
+from agentic.core.utils import AgentRunContext
+
+def citation(url: str) -> AnnotationURLCitation:
+    return AnnotationURLCitation(type="url_citation", url=url, title=url, start_index=0, end_index=1)
+
+def create_response() -> SimpleNamespace:
+    return SimpleNamespace(output=[
+        SimpleNamespace(type="web_search_call", id="ws_1", action=SimpleNamespace(query="nicegui", sources=None)),
+        SimpleNamespace(type="function_call", id="fc_1", name="draft_plan", arguments="{}"),
+        SimpleNamespace(type="message", content=[
+            SimpleNamespace(annotations=[citation("https://a.com"), citation("https://b.com"), citation("https://a.com")]),
+            SimpleNamespace(text="no annotations"),
+        ]),
+    ])
+
+class TestEventPublishingHook(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.events: List[AgentEvent] = []
+
+        async def subscriber(event: AgentEvent):
+            self.events.append(event)
+
+        self.publisher = EventPublisher(subscribers=[subscriber])
+        self.context = RunContextWrapper(context=AgentRunContext(event_publisher=self.publisher))
+        self.agent = SimpleNamespace(name="Manager")
+        self.hook = EventPublishingHook()
+
+    async def test_llm_end_emits_tool_events_with_deduplicated_citations(self):
+        await self.hook.on_llm_end(self.context, self.agent, create_response())
+        await self.publisher.flush()
+
+        event_types = [event.event_type for event in self.events]
+        self.assertEqual(event_types, ["tool_web_search_event", "tool_call_detected_event", "llm_ended_stream_event"])
+
+        sources = self.events[0].data["sources"]
+        self.assertIsInstance(sources, list)
+        self.assertEqual([source.url for source in sources], ["https://a.com", "https://b.com"])
+        self.assertEqual(self.events[1].data["tool_name"], "draft_plan")
+
+    async def test_web_search_event_serialises_sources_as_json_array(self):
+        await self.hook.on_llm_end(self.context, self.agent, create_response())
+        await self.publisher.flush()
+
+        payload = orjson.loads(self.events[0].to_json_bytes())
+        self.assertEqual([source["url"] for source in payload["data"]["sources"]], ["https://a.com", "https://b.com"])
+
+    async def test_no_events_without_subscribers(self):
+        context = RunContextWrapper(context=AgentRunContext(event_publisher=EventPublisher()))
+        await self.hook.on_llm_end(context, self.agent, create_response())
+        await self.hook.on_start(context, self.agent)
+        self.assertEqual(self.events, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import re
+import unittest
+from nicegui import ui
+from nicegui.elements.markdown import prepare_content
+from components.streaming_markdown import StreamingMarkdown, split_completed_blocks
+
+LOOSE_LIST = "1. **First**\n\n   Details\n\n2. **Second**\n\n   More\n"
+NESTED_LIST = "- one\n\n  - nested\n\n    continued\n\n- two\n"
+NESTED_FENCE = "Intro\n\n````markdown\nOpen a block with\n\n```\n\nText\n````\n\nAfter\n"
+TABLE = "Intro\n\n| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n\nAfter\n"
+
+def html(markdown: str) -> str:
+    # Render with ui.markdown's extras; whitespace between tags doesn't affect the result
+    rendered = prepare_content(markdown, " ".join(ui.markdown.default_extras))
+    return re.sub(r">\s+<", "><", rendered.strip())
+
+def stream(chunks):
+    view = StreamingMarkdown()
+    for chunk in chunks:
+        view.append(chunk)
+    return view
+
+def rendered_blocks(view):
+    return [child.content for child in view.default_slot.children]
+
+class TestSplitCompletedBlocks(unittest.TestCase):
+    def test_text_without_blank_line_is_all_tail(self):
+        self.assertEqual(split_completed_blocks("Hello wor"), ("", "Hello wor"))
+
+    def test_splits_before_the_last_block_whose_first_line_is_complete(self):
+        self.assertEqual(
+            split_completed_blocks("# Title\n\nFirst para.\n\nSecond"),
+            ("# Title", "First para.\n\nSecond"),
+        )
+        self.assertEqual(
+            split_completed_blocks("# Title\n\nFirst para.\n\nSecond\n"),
+            ("# Title\n\nFirst para.", "Second\n"),
+        )
+
+    def test_blank_line_inside_open_fence_is_not_a_boundary(self):
+        text = "Intro\n\n```python\nx = 1\n\ny = 2"
+        self.assertEqual(split_completed_blocks(text), ("Intro", "```python\nx = 1\n\ny = 2"))
+
+    def test_closed_fence_is_completed(self):
+        text = "```\na\n\nb\n```\n\nAfter\n"
+        self.assertEqual(split_completed_blocks(text), ("```\na\n\nb\n```", "After\n"))
+
+    def test_shorter_fence_inside_a_longer_one_does_not_close_it(self):
+        text = NESTED_FENCE[:NESTED_FENCE.index("Text")]
+        self.assertEqual(split_completed_blocks(text), ("Intro", text[len("Intro\n\n"):]))
+        self.assertEqual(split_completed_blocks(NESTED_FENCE), (NESTED_FENCE[:-len("\n\nAfter\n")], "After\n"))
+
+    def test_inline_backticks_do_not_open_a_fence(self):
+        text = "Wrap code in ``` fences.\n\nNext para.\n\nLast\n"
+        self.assertEqual(split_completed_blocks(text), ("Wrap code in ``` fences.\n\nNext para.", "Last\n"))
+
+    def test_list_items_and_continuations_are_not_boundaries(self):
+        self.assertEqual(split_completed_blocks(LOOSE_LIST), ("", LOOSE_LIST))
+        self.assertEqual(split_completed_blocks(NESTED_LIST), ("", NESTED_LIST))
+        self.assertEqual(split_completed_blocks("Intro\n\n- a\n\n- b\n"), ("", "Intro\n\n- a\n\n- b\n"))
+
+    def test_paragraph_after_a_list_ends_it(self):
+        text = "- a\n\n- b\n\nAfter the list\n"
+        self.assertEqual(split_completed_blocks(text), ("- a\n\n- b", "After the list\n"))
+
+class TestStreamingMarkdown(unittest.TestCase):
+    def assert_renders_like_whole_document(self, text, chunk_size=3):
+        view = stream(text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+        blocks = rendered_blocks(view)
+        self.assertEqual("\n\n".join(blocks), text)
+        self.assertEqual("".join(html(block) for block in blocks), html(text))
+        return blocks
+
+    def test_loose_list_stays_one_document(self):
+        self.assertEqual(len(self.assert_renders_like_whole_document(LOOSE_LIST)), 1)
+
+    def test_nested_list_stays_one_document(self):
+        self.assertEqual(len(self.assert_renders_like_whole_document(NESTED_LIST)), 1)
+
+    def test_headings_and_paragraphs_are_frozen(self):
+        text = "# Title\n\nFirst para.\n\n- a\n- b\n\n## Next\n\nLast"
+        self.assertGreater(len(self.assert_renders_like_whole_document(text)), 1)
+
+    def test_nested_fence_renders_like_whole_document(self):
+        self.assert_renders_like_whole_document(NESTED_FENCE)
+
+    def test_table_split_mid_stream_renders_like_whole_document(self):
+        for chunk_size in (3, 7, 11):
+            blocks = self.assert_renders_like_whole_document(TABLE, chunk_size)
+            self.assertIn("<table>", html(blocks[1]))
+
+    def test_reference_definition_merges_everything_back(self):
+        text = "See [the docs][docs].\n\nMore text.\n\n[docs]: https://example.com\n"
+        self.assertEqual(self.assert_renders_like_whole_document(text), [text])
+
+if __name__ == '__main__':
+    unittest.main()
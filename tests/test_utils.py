@@ -0,0 +1,43 @@
+import unittest
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import patch
+from agents.stream_events import AgentUpdatedStreamEvent, RawResponsesStreamEvent
+from openai.types.responses.response_text_delta_event import ResponseTextDeltaEvent
+from agentic.core.utils import stream_agent_output
+
+def delta(text: str) -> RawResponsesStreamEvent:
+    return RawResponsesStreamEvent(data=ResponseTextDeltaEvent.model_construct(type="response.output_text.delta", delta=text))
+
+def agent_updated(name: str) -> AgentUpdatedStreamEvent:
+    return AgentUpdatedStreamEvent(new_agent=SimpleNamespace(name=name))
+
+class FakeStreamingResult:
+    def __init__(self, events: list, final_output=None):
+        self._events = events
+        self.final_output = final_output
+
+    async def stream_events(self):
+        for event in self._events:
+            yield event
+
+async def collect(events: list, final_output=None, **kwargs) -> List[str]:
+    agent = SimpleNamespace(name="Manager")
+    with patch("agentic.core.utils.Runner.run_streamed", return_value=FakeStreamingResult(events, final_output)):
+        return [chunk async for chunk in stream_agent_output(agent, "prompt", **kwargs)]
+
+class TestStreamAgentOutput(unittest.IsolatedAsyncioTestCase):
+    async def test_deltas_are_coalesced_until_threshold(self):
+        chunks = await collect([delta("ab"), delta("cd"), delta("ef"), delta("g")], min_chunk_chars=4)
+        self.assertEqual(chunks, ["abcd", "efg"])
+
+    async def test_other_events_flush_the_buffer(self):
+        chunks = await collect([delta("ab"), agent_updated("Planner"), delta("ignored"), agent_updated("Manager"), delta("cd")])
+        self.assertEqual(chunks, ["ab", "cd"])
+
+    async def test_falls_back_to_final_output(self):
+        chunks = await collect([agent_updated("Manager")], final_output="done")
+        self.assertEqual(chunks, ["done"])
+
+if __name__ == '__main__':
+    unittest.main()